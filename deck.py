@@ -1,7 +1,27 @@
 # deck.py
 
-import random
 from card import Card # Importa la clase Card desde card.py
+# 'random' se importa dentro de shuffle(): su carga es la más costosa del arranque
+# y solo se necesita al barajar, no al importar el módulo.
+
+SUITS = ['Corazones', 'Diamantes', 'Tréboles', 'Espadas']
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+# Plantilla de las 52 cartas, construida una sola vez en el primer uso.
+# Las cartas no se modifican durante el juego, así que cada mazo puede compartirlas.
+_CARD_TEMPLATE = None
+
+def _card_template():
+    """Retorna la plantilla de 52 cartas, construyéndola la primera vez que se pide."""
+    global _CARD_TEMPLATE
+    if _CARD_TEMPLATE is None:
+        _CARD_TEMPLATE = tuple(Card(suit, rank) for suit in SUITS for rank in RANKS)
+    return _CARD_TEMPLATE
+
+def warm_up():
+    """Importa 'random' y construye la plantilla de 52 cartas."""
+    import random  # noqa: F401 - deja el módulo cargado en memoria
+    _card_template()
 
 class Deck:
     """Representa el mazo de 52 cartas."""
@@ -11,14 +31,11 @@ class Deck:
 
     def _build(self):
         """Construye un mazo estándar de 52 cartas."""
-        suits = ['Corazones', 'Diamantes', 'Tréboles', 'Espadas']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        for suit in suits:
-            for rank in ranks:
-                self.cards.append(Card(suit, rank))
+        self.cards = list(_card_template())
 
     def shuffle(self):
         """Baraja las cartas del mazo."""
+        import random
         random.shuffle(self.cards)
         print("Mazo barajado.")
 
@@ -1,6 +1,7 @@
 # hand_evaluator.py
 
-from collections import Counter
+# 'Counter' se importa dentro de evaluate_hand(): cargar 'collections' al importar
+# el módulo retrasaría el arranque del juego aunque aún no se evalúe ninguna mano.
 # No necesitamos importar Card aquí si solo trabajamos con sus ranks numéricos
 
 # --- Constantes para la Evaluación de Manos ---
@@ -17,6 +18,9 @@ VALUE_RANKS = {
     11: 'J', 12: 'Q', 13: 'K', 14: 'A', 1: 'A' # Para el As como 1 en la escalera baja
 }
 
+# Valores de la escalera baja (A-2-3-4-5)
+LOW_STRAIGHT_RANKS = frozenset({RANK_VALUES['A'], RANK_VALUES['5'], RANK_VALUES['4'], RANK_VALUES['3'], RANK_VALUES['2']})
+
 # Clases de manos de póker (para asignar un "tipo" y un valor de desempate)
 # Asignar un valor numérico a cada tipo de mano para poder compararlas
 HAND_RANKS = {
@@ -32,6 +36,10 @@ HAND_RANKS = {
     "Escalera Real": 9
 }
 
+def warm_up():
+    """Importa 'collections', que evaluate_hand() carga en su primer uso."""
+    from collections import Counter  # noqa: F401 - deja el módulo cargado en memoria
+
 # --- Funciones Auxiliares para evaluar Escalera y Ases ---
 
 def check_straight(sorted_ranks):
@@ -47,7 +55,7 @@ def check_straight(sorted_ranks):
     # Caso especial de escalera baja (A-2-3-4-5)
     # Si las cartas son A, 5, 4, 3, 2 (valores numéricos 14, 5, 4, 3, 2)
     # Se Convierten los valores para la comparación a (1,2,3,4,5)
-    if set(sorted_ranks) == {RANK_VALUES['A'], RANK_VALUES['5'], RANK_VALUES['4'], RANK_VALUES['3'], RANK_VALUES['2']}:
+    if set(sorted_ranks) == LOW_STRAIGHT_RANKS:
         # Si es A-2-3-4-5, se considera escalera. Aquí se normaliza el As a 1 si es necesario para el tie_breaker
         return True
     
@@ -63,6 +71,8 @@ def evaluate_hand(hand):
     if len(hand) != 5:
         raise ValueError("Una mano debe tener exactamente 5 cartas.")
 
+    from collections import Counter
+
     # Asegúrate de que 'hand' contiene objetos Card con atributo 'rank'
     ranks = [RANK_VALUES[card.rank] for card in hand]
     suits = [card.suit for card in hand]
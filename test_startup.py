@@ -0,0 +1,59 @@
+# test_startup.py
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Presupuesto para la importación acumulada de 'main' (en microsegundos). Antes de diferir
+# 'random' y 'collections' costaba ~15 ms; después ~1 ms. El presupuesto queda por debajo
+# del coste anterior para detectar la regresión, con margen para máquinas más lentas.
+IMPORT_BUDGET_US = 3_000
+
+# Se toma el mejor de varios intentos para que un pico de carga no haga fallar la prueba
+IMPORT_TIME_RUNS = 3
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _run_python(*args, env=None):
+    """Ejecuta un intérprete nuevo en el directorio del proyecto y retorna el proceso terminado."""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+class StartupTest(unittest.TestCase):
+    """Verifica que importar el juego no cargue dependencias pesadas antes de tiempo."""
+
+    def test_heavy_modules_are_deferred(self):
+        result = _run_python(
+            "-c",
+            "import sys, main; print(' '.join(m for m in ('random', 'collections') if m in sys.modules))",
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_import_time_budget(self):
+        # Se mide con el bytecode ya compilado en una caché propia: de lo contrario el tiempo
+        # incluiría la compilación de los .py (p. ej. con PYTHONDONTWRITEBYTECODE definido)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+            _run_python("-c", "import main", env=env)
+            timings = [self._main_import_time(env) for _ in range(IMPORT_TIME_RUNS)]
+        self.assertLess(min(timings), IMPORT_BUDGET_US)
+
+    def _main_import_time(self, env):
+        """Retorna el tiempo acumulado de 'import main' (en microsegundos) según -X importtime."""
+        result = _run_python("-X", "importtime", "-c", "import main", env=env)
+        match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| main$", result.stderr, re.MULTILINE)
+        self.assertIsNotNone(match, "No se encontró la línea de 'main' en la salida de -X importtime")
+        return int(match.group(1))
+
+if __name__ == "__main__":
+    unittest.main()
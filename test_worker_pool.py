@@ -0,0 +1,71 @@
+# test_worker_pool.py
+
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import unittest
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Tiempo máximo de espera para cada paso de la prueba (en segundos)
+TIMEOUT = 5
+
+CLEAR_SEQUENCE = b"\033[H\033[2J"
+
+def _read_until(conn, marker):
+    """Lee del socket hasta recibir 'marker' y retorna todo lo recibido."""
+    data = b""
+    while marker not in data:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+@unittest.skipUnless(hasattr(os, 'fork'), "El modo de procesos precalentados requiere os.fork()")
+class WorkerPoolTest(unittest.TestCase):
+    """Prueba de humo del servidor: partidas por socket, reemplazo de procesos y cierre con SIGTERM."""
+
+    def setUp(self):
+        env = dict(os.environ)
+        env.pop("TERM", None) # Como en 'docker run' sin -t
+        self.server = subprocess.Popen(
+            [sys.executable, "-c", "import worker_pool; worker_pool.run_pool('127.0.0.1', 0, 1)"],
+            cwd=PROJECT_DIR,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        banner = self.server.stdout.readline().decode('utf-8')
+        match = re.search(r":(\d+) con", banner)
+        self.assertIsNotNone(match, f"Mensaje de inicio inesperado: {banner!r}")
+        self.port = int(match.group(1))
+
+    def tearDown(self):
+        if self.server.poll() is None:
+            self.server.kill()
+        self.server.communicate(timeout=TIMEOUT)
+
+    def _connect(self):
+        return socket.create_connection(('127.0.0.1', self.port), timeout=TIMEOUT)
+
+    def test_sessions_and_shutdown(self):
+        with self._connect() as conn:
+            data = _read_until(conn, "Tu acción".encode('utf-8'))
+        self.assertIn("¡Bienvenido al juego de Póker en Consola!".encode('utf-8'), data)
+        self.assertIn(CLEAR_SEQUENCE, data)
+        self.assertNotIn(b"TERM", data)
+
+        # El único proceso terminó con la primera partida: la segunda la atiende su reemplazo
+        with self._connect() as conn:
+            data = _read_until(conn, "Bienvenido".encode('utf-8'))
+        self.assertIn("Bienvenido".encode('utf-8'), data)
+
+        self.server.send_signal(signal.SIGTERM)
+        self.assertEqual(self.server.wait(timeout=TIMEOUT), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# worker_pool.py
+
+import io
+import os
+import signal
+import socket
+import sys
+import time
+
+# Modo de procesos precalentados: el proceso principal importa el juego e inicializa
+# las tablas una sola vez y luego crea (fork) varios procesos que esperan conexiones.
+# Cada partida la atiende un proceso ya inicializado, así que empieza al instante.
+# Uso: python worker_pool.py [--host 0.0.0.0] [--puerto 5000] [--workers 4]
+# Para jugar: nc <host> <puerto>  (o telnet)
+
+DEFAULT_HOST = '0.0.0.0'
+DEFAULT_PORT = 5000
+DEFAULT_WORKERS = 4
+
+# Pausa antes de reemplazar un proceso que terminó con error (p. ej. accept() falló
+# con EMFILE), para no entrar en un bucle de fork/wait.
+CRASH_BACKOFF = 1.0
+
+def _warm_up():
+    """
+    Importa el juego y fuerza su inicialización diferida antes de crear los procesos.
+    Así los procesos hijos heredan los módulos ya cargados y ninguna partida paga ese coste.
+    """
+    import main
+    import deck
+    import hand_evaluator
+    deck.warm_up()
+    hand_evaluator.warm_up()
+    return main
+
+def _clear_screen():
+    """
+    Limpia la pantalla del cliente con la secuencia ANSI.
+    Sustituye a os.system('clear'), que por el socket mostraría errores si TERM no
+    está definido y además crearía un proceso de shell en cada pantalla.
+    """
+    sys.stdout.write("\033[H\033[2J")
+    sys.stdout.flush()
+
+def _serve_session(conn, game):
+    """
+    Conecta la entrada/salida estándar del proceso al socket y ejecuta una partida.
+    El juego usa print() e input(), así que no necesita saber que juega por red.
+    """
+    fd = conn.fileno()
+    for std_fd in (0, 1, 2):
+        os.dup2(fd, std_fd)
+    sys.stdin = io.TextIOWrapper(io.FileIO(0, 'rb', closefd=False), encoding='utf-8', errors='replace')
+    sys.stdout = io.TextIOWrapper(io.FileIO(1, 'wb', closefd=False), encoding='utf-8', line_buffering=True)
+    sys.stderr = sys.stdout
+    game.clear_console = _clear_screen
+
+    # El proceso pertenece a una sola partida: se vuelve a sembrar el azar para que
+    # los procesos creados a partir del mismo padre no barajen igual.
+    import random
+    random.seed()
+
+    try:
+        game.main()
+    except (EOFError, ConnectionError):
+        pass # El cliente cerró la conexión a mitad de partida
+    finally:
+        try:
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
+
+def _worker(listener, game):
+    """
+    Espera una conexión, juega esa partida y termina. El proceso principal lo reemplaza.
+    Si algo falla, escribe el error en el stderr del servidor y sale con código 1,
+    para que el principal espere antes de reemplazarlo.
+    """
+    exit_code = 1
+    log_fd = 2
+    try:
+        signal.signal(signal.SIGINT, signal.SIG_IGN) # Ctrl+C lo gestiona el proceso principal
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        conn, _ = listener.accept()
+        listener.close()
+        # _serve_session redirige el fd 2 al socket: se guarda el stderr del servidor
+        log_fd = os.dup(2)
+        _serve_session(conn, game)
+        exit_code = 0
+    except Exception:
+        import traceback
+        os.write(log_fd, traceback.format_exc().encode('utf-8', 'replace'))
+    finally:
+        os._exit(exit_code)
+
+def run_pool(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=DEFAULT_WORKERS):
+    """
+    Inicia el servidor con 'workers' procesos precalentados esperando partidas.
+    Cada proceso atiende una sola partida; al terminar se crea otro desde el proceso
+    principal, que ya está inicializado, para mantener el grupo siempre lleno.
+    """
+    if not hasattr(os, 'fork'):
+        raise RuntimeError("El modo de procesos precalentados requiere os.fork() (Linux/macOS).")
+    if workers < 1:
+        raise ValueError("Se necesita al menos un proceso para atender partidas.")
+
+    game = _warm_up()
+    # 'docker stop' envía SIGTERM: se convierte en salida normal para cerrar los procesos hijos
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    listener = socket.create_server((host, port))
+    port = listener.getsockname()[1] # Puerto real si se pidió el 0 (elegido por el sistema)
+    children = set()
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            _worker(listener, game)
+        children.add(pid)
+
+    # flush antes de crear los procesos: sin tty (Docker) la salida va en bloques y el
+    # búfer pendiente se copiaría en cada proceso hijo
+    print(f"Servidor de Póker escuchando en {host}:{port} con {workers} proceso(s) precalentado(s).", flush=True)
+    for _ in range(workers):
+        spawn()
+
+    try:
+        while True:
+            pid, status = os.wait()
+            if pid in children:
+                children.discard(pid)
+                if os.waitstatus_to_exitcode(status) != 0:
+                    time.sleep(CRASH_BACKOFF)
+                spawn()
+    except KeyboardInterrupt:
+        print("\nDeteniendo el servidor...")
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        listener.close()
+
+def _parse_args(argv):
+    """Lee las opciones de línea de comandos."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Servidor de Póker con procesos precalentados.")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--puerto', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = _parse_args(sys.argv[1:])
+    run_pool(args.host, args.puerto, args.workers)